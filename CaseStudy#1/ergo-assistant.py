@@ -9,9 +9,15 @@ Step 3 Requirements Demonstrated:
   - Risk scoring encourages safer habits (health/safety)
   - Supportive recommendations improve confidence (satisfaction)
 """
+import bisect
+import functools
+import re
+import sys
+from collections import deque
 from dataclasses import dataclass, field
+from typing import Iterable, Iterator, NamedTuple
 
-@dataclass
+@dataclass(slots=True)
 class UserProfile:
     hand_size: str
     grip_style: str
@@ -25,28 +31,105 @@ class UserProfile:
     #Derived attributes
     risk_points: int=0
     risk_level: str="none"
-    recommendations: list[str]=field(default_factory=list)
+    # Filled only through add_recommendation(): the deque keeps order, the set answers membership
+    recommendations: deque[str]=field(default_factory=deque)
+    _rec_set: set[str]=field(default_factory=set, repr=False)
     
     #Convenience attributes for risk assessment
     has_wrist_pain: bool = False
     has_finger_pain: bool = False
     has_forearm_pain: bool = False
     
+class ProfileKey(NamedTuple):
+    """Hashable snapshot of the UserProfile inputs that evaluate() depends on.
+
+    Numeric inputs are reduced to the bucket the rules act on and the free-text
+    discomfort note to its pain flags, so equivalent profiles share a cache entry.
+    """
+    hand_size: str
+    grip_style: str
+    session_bucket: int
+    has_wrist_pain: bool
+    has_finger_pain: bool
+    has_forearm_pain: bool
+    keyboard_layout: str
+    weight_bucket: int | None
+    space_issue: str
+    game_type: str
+    
+# Recommendation lookup tables
+# Mouse shape/size recommendation keyed by hand_size, then grip_style
+_GRIP_MSGS: dict[str, dict[str, str]] = {
+    "small": {
+        "fingertip": "Small hand + fingertip grip: consider a smaller, lighter mouse (40-70g) with a shape that allows for easy fingertip control.",
+        "claw": "Small hand + claw grip: consider a smaller mouse (40-70g) with a shape that supports the arch of your hand and allows for easy claw grip.",
+        "palm": "Small hand + palm grip: consider a smaller mouse (40-70g) with a shape that allows your palm to rest comfortably on the rear of the mouse.",
+    },
+    "medium": {
+        "fingertip": "Medium hand + fingertip grip: consider a lighter medium-sized mouse (50-80g) with a shape that allows for easy fingertip control.",
+        "claw": "Medium hand + claw grip: consider a medium-sized mouse (50-80g) with a shape that supports the arch of your hand and allows for easy claw grip.",
+        "palm": "Medium hand + palm grip: consider a medium-sized mouse (50-80g) with a shape that allows your palm to rest comfortably on the rear of the mouse.",
+    },
+    "large": {
+        "fingertip": "Large hand + fingertip grip: consider a medium-sized mouse (60-90g) with a shape that allows for easy fingertip control.",
+        "claw": "Large hand + claw grip: consider a medium to larger mouse (60-100g) with a shape that supports the arch of your hand and allows for easy claw grip.",
+        "palm": "Large hand + palm grip: consider a medium to larger mouse (60-100g) with a shape that allows your palm to rest comfortably on the rear of the mouse.",
+    },
+}
+_NO_GRIP_MSGS: dict[str, str] = {}
+
+# Break and posture recommendation keyed by game_type
+_GAME_MSGS: dict[str, str] = {
+    "fps": "FPS focus: prioritize consistent sensitivity and a comfortable mouse grip to reduce micro-adjustment strain.",
+    "moba": "MOBA focus: consider a mouse with good button placement for quick access to abilities and macros.",
+    "rpg": "RPG focus: consider a mouse with good comfort for longer sessions and customizable buttons for inventory management.",
+    "mmorpg": "MMORPG focus: consider a mouse with good comfort for longer sessions and customizable buttons for inventory management and macros.",
+    "other": "General gaming: focus on overall comfort, proper breaks, and ergonomic posture to reduce strain across various game types.",
+}
+
+# Risk level by points: below 1 is none, 1-2 mild, 3-4 moderate, 5+ high
+_RISK_THRESHOLDS = (1, 3, 5)
+_RISK_LEVELS = ("none", "mild", "moderate", "high")
+
+# Discomfort text is split into whole words so e.g. "fingertip" is not read as "finger"
+_WORD_RE = re.compile(r"[a-z]+")
+
 # Input helper functions    
+# Pre-read answers when stdin is piped/redirected; None means read interactively
+_answers: Iterator[str] | None = None
+
+def read_answer(prompt: str) -> str:
+    """Read one answer line, from the pre-read buffer if one is loaded, else via input()."""
+    if _answers is None:
+        return input(prompt)
+    sys.stdout.write(prompt)
+    try:
+        return next(_answers)
+    except StopIteration:
+        raise EOFError("no more answers on stdin") from None
+        
+@functools.lru_cache(maxsize=None)
+def _allowed_choices(choices: tuple[str, ...]) -> dict[str, str]:
+    """Lowercased answer -> canonical choice, built once per choice set."""
+    return {c.lower(): c for c in choices}
+    
 def ask_choise(prompt: str, choices: list[str]) -> str:
     """Prompt user until they enter a valid choice."""
-    allowed = {c.lower(): c for c in choices}
+    allowed = _allowed_choices(tuple(choices))
     while True:
-        ans = input(f"{prompt} ({'/'.join(choices)}): ").strip().lower()
-        if ans in allowed:
-            return ans
+        ans = read_answer(f"{prompt} ({'/'.join(choices)}): ").strip()
+        # Skip the lower() copy for answers already typed in lowercase (the usual case)
+        choice = allowed.get(ans if ans.islower() else ans.lower())
+        if choice is not None:
+            # The canonical choice is the caller's literal, so rule comparisons hit the identity fast path
+            return choice
         print(f"Invalid choice. Please choose from: {', '.join(choices)}.")
         
         
 def ask_int(prompt: str, min_val: int = 0, max_val: int = 10**9) -> int:
     """Promput user until they enter a valid integer within the specified range."""
     while True:
-        raw = input(f"{prompt}: ").strip()
+        raw = read_answer(f"{prompt}: ").strip()
         try:
             val = int(raw)
             if min_val <= val <= max_val:
@@ -58,153 +141,201 @@ def ask_int(prompt: str, min_val: int = 0, max_val: int = 10**9) -> int:
 def ask_mouse_weight() -> int | None:
     """Ask user for mouse weight, allowing for 'don't know'."""
     while True:
-        raw = input("What is the weight of your mouse in grams? (or type 'don't know'): ").strip().lower()
-        if raw == "don't know":
-            return None
-        try:
+        raw = read_answer("What is the weight of your mouse in grams? (or type 'don't know'): ").strip()
+        # Numeric answers are the common case, so check them before the sentinel; valid weights
+        # have at most 3 digits, longer input goes through the try below (int() caps digit count)
+        if raw.isdecimal() and len(raw) <= 3:
             weight = int(raw)
-            if 200 >= weight >= 20:
-                return weight
-            print("Weight must be a realistic value (20-200g) or 'don't know'.")
-        except ValueError:
-            print("Invalid input. Please enter a valid integer or 'don't know'.")
+        elif (raw if raw.islower() else raw.lower()) == "don't know":
+            return None
+        else:
+            try:
+                weight = int(raw)
+            except ValueError:
+                print("Invalid input. Please enter a valid integer or 'don't know'.")
+                continue
+        if 200 >= weight >= 20:
+            return weight
+        print("Weight must be a realistic value (20-200g) or 'don't know'.")
             
 # Analysis & rules
 def parse_discomfort(profile: UserProfile) -> None:
     """Keyword parsing for discomfort level to set pain flags."""
-    text = profile.discomfort_level.lower()
-    profile.has_wrist_pain = "wrist" in text
-    profile.has_finger_pain = "finger" in text or "fingers" in text
-    profile.has_forearm_pain = "forearm" in text
-    if "none" in text:
+    tokens = frozenset(_WORD_RE.findall(profile.discomfort_level.lower()))
+    profile.has_wrist_pain = "wrist" in tokens or "wrists" in tokens
+    profile.has_finger_pain = "finger" in tokens or "fingers" in tokens
+    profile.has_forearm_pain = "forearm" in tokens or "forearms" in tokens
+    if "none" in tokens:
         profile.has_wrist_pain = False
         profile.has_finger_pain = False
         profile.has_forearm_pain = False
         
 def add_recommendation(profile: UserProfile, msg: str) -> None:
     """Add a recommendation to the profile if it's not already present."""
-    if msg not in profile.recommendations:
+    if msg not in profile._rec_set:
+        profile._rec_set.add(msg)
         profile.recommendations.append(msg)
         
+def session_bucket(minutes: int) -> int:
+    """Bucket a session length: 0 = under 90 min, 1 = 90-179 min, 2 = 180+ min."""
+    return 2 if minutes >= 180 else 1 if minutes >= 90 else 0
+    
+def weight_bucket(grams: int | None) -> int | None:
+    """Bucket a mouse weight: 0 = 60g or less, 1 = 61-70g, 2 = 71-95g, 3 = over 95g, None = unknown."""
+    if grams is None:
+        return None
+    return 3 if grams > 95 else 2 if grams > 70 else 1 if grams > 60 else 0
+    
+def profile_key(profile: UserProfile) -> ProfileKey:
+    """Parse the discomfort note and reduce the profile to the key the rules act on."""
+    parse_discomfort(profile)
+    return ProfileKey(
+        profile.hand_size,
+        profile.grip_style,
+        session_bucket(profile.session_duration),
+        profile.has_wrist_pain,
+        profile.has_finger_pain,
+        profile.has_forearm_pain,
+        profile.keyboard_layout,
+        weight_bucket(profile.mouse_weight),
+        profile.space_issue,
+        profile.game_type,
+    )
+    
+def apply_result(profile: UserProfile, points: int, recs: tuple[str, ...]) -> None:
+    """Add rule results to the profile and update its risk level."""
+    profile.risk_points += points
+    for msg in recs:
+        add_recommendation(profile, msg)
+        
+    # Final risk level assessment
+    profile.risk_level = _RISK_LEVELS[bisect.bisect_right(_RISK_THRESHOLDS, profile.risk_points)]
+    
 def evaluate(profile: UserProfile) -> None:
     """Rule based evaluation of the user profile to determine risk points, level, and recommendations."""
-    parse_discomfort(profile)
+    apply_result(profile, *_evaluate_rules(profile_key(profile)))
+    
+def evaluate_batch(profiles: Iterable[UserProfile]) -> None:
+    """Evaluate many profiles, running the rules once per group of profiles that share a key.
+
+    Rules are called directly rather than through the evaluate() cache, so a large
+    one-off sweep does not fill it.
+    """
+    groups: dict[ProfileKey, list[UserProfile]] = {}
+    for profile in profiles:
+        groups.setdefault(profile_key(profile), []).append(profile)
+    for key, group in groups.items():
+        points, recs = _evaluate_rules.__wrapped__(key)
+        for profile in group:
+            apply_result(profile, points, recs)
+            
+# Unbounded: validated answers give at most 3*3*3*2*2*2*3*5*2*5 = 32,400 distinct keys
+@functools.lru_cache(maxsize=None)
+def _evaluate_rules(key: ProfileKey) -> tuple[int, tuple[str, ...]]:
+    """Apply the rules to a bucketed profile key, returning (risk points, recommendations).
+
+    Results are memoized per distinct key; evaluate() adds them to the profile.
+    """
+    # Unpack once so the rules below read plain locals instead of tuple attributes
+    hs, gs, sb, wrist_pain, finger_pain, forearm_pain, kl, wb, si, gt = key
+    points = 0
+    recs: list[str] = []
     
     # Session length contributes to risk
-    if profile.session_duration >= 180:
-        profile.risk_points += 2
-        add_recommendation(profile, "Long sessions detected: add structured 5-10 minute breaks every 45-60 minutes.")
-    elif profile.session_duration >= 90:
-        profile.risk_points += 1
-        add_recommendation(profile, "Consider adding regular breaks to your gaming sessions.")
+    if sb == 2:
+        points += 2
+        recs.append("Long sessions detected: add structured 5-10 minute breaks every 45-60 minutes.")
+    elif sb == 1:
+        points += 1
+        recs.append("Consider adding regular breaks to your gaming sessions.")
         
     # Discomfort contributes to risk
-    if profile.has_wrist_pain:
-        profile.risk_points += 2
-        add_recommendation(profile, "Wrist discomfort: consider a lighter mouse, neutral wrist position (avoid excessive extension), and wrist support. ")
-        add_recommendation(profile, "Try slight keyboard angle adjustment to keep wrists straight.")
-    if profile.has_finger_pain:
-        profile.risk_points += 1
-        add_recommendation(profile, "Finger discomfort: consider a mouse with a more ergonomic shape that supports your hand size better.")
-        add_recommendation(profile, "Finger discomfort: consider lighter actuation force for keys and mouse buttons.")
-    if profile.has_forearm_pain:
-        profile.risk_points += 1
-        add_recommendation(profile, "Forearm discomfort: ensure your chair and desk height allow for a 90-degree angle at the elbow.")
+    if wrist_pain:
+        points += 2
+        recs.append("Wrist discomfort: consider a lighter mouse, neutral wrist position (avoid excessive extension), and wrist support. ")
+        recs.append("Try slight keyboard angle adjustment to keep wrists straight.")
+    if finger_pain:
+        points += 1
+        recs.append("Finger discomfort: consider a mouse with a more ergonomic shape that supports your hand size better.")
+        recs.append("Finger discomfort: consider lighter actuation force for keys and mouse buttons.")
+    if forearm_pain:
+        points += 1
+        recs.append("Forearm discomfort: ensure your chair and desk height allow for a 90-degree angle at the elbow.")
         
     # Hand size and grip style contributes to mouse shape/size recommendations
-    if profile.hand_size == "small" and profile.grip_style == "fingertip":
-        add_recommendation(profile, "Small hand + fingertip grip: consider a smaller, lighter mouse (40-70g) with a shape that allows for easy fingertip control.")
-    elif profile.hand_size == "medium" and profile.grip_style == "fingertip":
-        add_recommendation(profile, "Medium hand + fingertip grip: consider a lighter medium-sized mouse (50-80g) with a shape that allows for easy fingertip control.")
-    elif profile.hand_size == "large" and profile.grip_style == "fingertip":
-        add_recommendation(profile, "Large hand + fingertip grip: consider a medium-sized mouse (60-90g) with a shape that allows for easy fingertip control.")
-    elif profile.hand_size == "small" and profile.grip_style == "claw":
-        add_recommendation(profile, "Small hand + claw grip: consider a smaller mouse (40-70g) with a shape that supports the arch of your hand and allows for easy claw grip.")
-    elif profile.hand_size == "medium" and profile.grip_style == "claw":
-        add_recommendation(profile, "Medium hand + claw grip: consider a medium-sized mouse (50-80g) with a shape that supports the arch of your hand and allows for easy claw grip.")
-    elif profile.hand_size == "large" and profile.grip_style == "claw":
-        add_recommendation(profile, "Large hand + claw grip: consider a medium to larger mouse (60-100g) with a shape that supports the arch of your hand and allows for easy claw grip.")
-    elif profile.hand_size == "small" and profile.grip_style == "palm":
-        add_recommendation(profile, "Small hand + palm grip: consider a smaller mouse (40-70g) with a shape that allows your palm to rest comfortably on the rear of the mouse.")
-    elif profile.hand_size == "medium" and profile.grip_style == "palm":
-        add_recommendation(profile, "Medium hand + palm grip: consider a medium-sized mouse (50-80g) with a shape that allows your palm to rest comfortably on the rear of the mouse.")
-    elif profile.hand_size == "large" and profile.grip_style == "palm":
-        add_recommendation(profile, "Large hand + palm grip: consider a medium to larger mouse (60-100g) with a shape that allows your palm to rest comfortably on the rear of the mouse.")
+    msg = _GRIP_MSGS.get(hs, _NO_GRIP_MSGS).get(gs)
+    if msg:
+        recs.append(msg)
         
     # Mouse weight contributes to risk
-    if profile.mouse_weight is not None:
-        if profile.mouse_weight > 95:
-            profile.risk_points += 1
-            add_recommendation(profile, "Heavy mouse detected: consider switching to a lighter mouse (50-80g) to reduce strain.")
-        elif profile.mouse_weight > 70:
-            profile.risk_points += 1
-            add_recommendation(profile, "Consider switching to a lighter mouse (50-70g) to reduce strain.")
-        elif profile.mouse_weight <= 60:
-            add_recommendation(profile, "Your mouse weight is within a good range for ergonomic gaming.")
+    if wb is not None:
+        if wb == 3:
+            points += 1
+            recs.append("Heavy mouse detected: consider switching to a lighter mouse (50-80g) to reduce strain.")
+        elif wb == 2:
+            points += 1
+            recs.append("Consider switching to a lighter mouse (50-70g) to reduce strain.")
+        elif wb == 0:
+            recs.append("Your mouse weight is within a good range for ergonomic gaming.")
     else:
-        add_recommendation(profile, "Mouse weight unknown: if you experience discomfort, consider checking your mouse weight.")
+        recs.append("Mouse weight unknown: if you experience discomfort, consider checking your mouse weight.")
         
     #keyboard layout contributes to wrist position recommendations
-    if profile.keyboard_layout == "wasd" and profile.hand_size == "large":
-        add_recommendation(profile, "Large hands: consider trying ESDf for more key reach and centralized hand position.")
-    elif profile.keyboard_layout == "esdf" and profile.hand_size == "small":
-        add_recommendation(profile, "Small hands: consider trying WASD for more compact key reach and centralized hand position.")
-    if profile.space_issue == "yes":
-        add_recommendation(profile, "Space constraints: consider a compact keyboard layout (e.g. 60% or 65%) and a larger mousepad to allow for better mouse positioning and reduce shoulder strain.")
+    if kl == "wasd" and hs == "large":
+        recs.append("Large hands: consider trying ESDf for more key reach and centralized hand position.")
+    elif kl == "esdf" and hs == "small":
+        recs.append("Small hands: consider trying WASD for more compact key reach and centralized hand position.")
+    if si == "yes":
+        recs.append("Space constraints: consider a compact keyboard layout (e.g. 60% or 65%) and a larger mousepad to allow for better mouse positioning and reduce shoulder strain.")
         
     # Game type contributes to break and posture recommendations
-    if profile.game_type == "fps":
-        add_recommendation(profile, "FPS focus: prioritize consistent sensitivity and a comfortable mouse grip to reduce micro-adjustment strain.")
-    elif profile.game_type == "moba":
-        add_recommendation(profile, "MOBA focus: consider a mouse with good button placement for quick access to abilities and macros.")
-    elif profile.game_type == "rpg":
-        add_recommendation(profile, "RPG focus: consider a mouse with good comfort for longer sessions and customizable buttons for inventory management.")
-    elif profile.game_type == "mmorpg":
-        add_recommendation(profile, "MMORPG focus: consider a mouse with good comfort for longer sessions and customizable buttons for inventory management and macros.")
-    elif profile.game_type == "other":
-        add_recommendation(profile, "General gaming: focus on overall comfort, proper breaks, and ergonomic posture to reduce strain across various game types.")
+    msg = _GAME_MSGS.get(gt)
+    if msg:
+        recs.append(msg)
         
-    # Final risk level assessment
-    if profile.risk_points >= 5:
-        profile.risk_level = "high"
-    elif profile.risk_points >= 3:
-        profile.risk_level = "moderate"
-    elif profile.risk_points >= 1:
-        profile.risk_level = "mild"
-    else:
-        profile.risk_level = "none"
+    return points, tuple(recs)
         
 # UI program flow
 def print_results(profile: UserProfile) -> None:
-    print("\n" + "=" * 50)
-    print("Ergonomic Configuration Summary")
-    print("=" * 50)
-    print(f"Hand size: {profile.hand_size}")
-    print(f"Grip style: {profile.grip_style}")
-    print(f"Session duration: {profile.session_duration} minutes")
-    print(f"Discomfort notes: {profile.discomfort_level.strip() or '(none given)'}")
-    print(f"Keyboard layout: {profile.keyboard_layout}")
-    print(f"Mouse weight: {profile.mouse_weight if profile.mouse_weight is not None else '(unknown)'} grams")
-    print(f"Space constraints: {profile.space_issue}")
-    print(f"Game type: {profile.game_type}")
-    print(f"\nRisk level: {profile.risk_level.upper()} (Points: {profile.risk_points})")
-    print("\nRecommendations:")
-    if not profile.recommendations:
-        print("- No specific recommendations. Your current setup appears to be low risk.")
+    rule = "=" * 50
+    if profile.recommendations:
+        recs = "\n".join("- " + rec for rec in profile.recommendations)
     else:
-        for rec in profile.recommendations:
-            print(f"- {rec}")
-    print("=" * 50 + "\n")
+        recs = "- No specific recommendations. Your current setup appears to be low risk."
+    mouse_weight = profile.mouse_weight if profile.mouse_weight is not None else "(unknown)"
+    # Build the whole summary first so it goes out in a single write
+    sys.stdout.write(
+        f"\n{rule}\n"
+        "Ergonomic Configuration Summary\n"
+        f"{rule}\n"
+        f"Hand size: {profile.hand_size}\n"
+        f"Grip style: {profile.grip_style}\n"
+        f"Session duration: {profile.session_duration} minutes\n"
+        f"Discomfort notes: {profile.discomfort_level.strip() or '(none given)'}\n"
+        f"Keyboard layout: {profile.keyboard_layout}\n"
+        f"Mouse weight: {mouse_weight} grams\n"
+        f"Space constraints: {profile.space_issue}\n"
+        f"Game type: {profile.game_type}\n"
+        f"\nRisk level: {profile.risk_level.upper()} (Points: {profile.risk_points})\n"
+        "\nRecommendations:\n"
+        f"{recs}\n"
+        f"{rule}\n\n"
+    )
     
 def main():
+    global _answers
+    if not sys.stdin.isatty():
+        # Scripted run: read every answer with one read instead of one input() per prompt
+        _answers = iter(sys.stdin.read().splitlines())
+        
     print("Welcome to the Ergonomic Configuration Assistant Prototype!")
     print("Answer a few questions about your gaming setup and habits to receive personalized ergonomic recommendations.\n")
     
     hand_size = ask_choise("What is your hand size?", ["small", "medium", "large"])
     grip_style = ask_choise("What is your primary mouse grip style?", ["fingertip", "claw", "palm"])
     session_duration = ask_int("On average, how long are your gaming sessions in minutes?", min_val=1)
-    discomfort_level = input("Do you experience any discomfort while gaming? If so, please describe (e.g. 'wrist pain', 'finger discomfort', 'forearm ache', or 'none'): ").strip()
-    keyboard_layout = ask_choise("What keyboard layout do you use for gaming?", ["wasd", "esdf", "other"]).lower()
+    discomfort_level = read_answer("Do you experience any discomfort while gaming? If so, please describe (e.g. 'wrist pain', 'finger discomfort', 'forearm ache', or 'none'): ").strip()
+    keyboard_layout = ask_choise("What keyboard layout do you use for gaming?", ["wasd", "esdf", "other"])
     mouse_weight = ask_mouse_weight()
     space_issue = ask_choise("Do you have space constraints at your gaming setup?", ["yes", "no"])
     game_type = ask_choise("What type of games do you primarily play?", ["fps", "moba", "rpg", "mmorpg", "other"])
@@ -0,0 +1,185 @@
+"""
+Regression tests for the ergonomic assistant's rule engine and input helpers.
+
+Run from this directory with: python -m unittest test_ergo_assistant
+"""
+import contextlib
+import importlib.util
+import io
+import itertools
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# The script's file name has a hyphen, so load it by path
+_spec = importlib.util.spec_from_file_location("ergo_assistant", Path(__file__).with_name("ergo-assistant.py"))
+ergo = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(ergo)
+
+HAND_SIZES = ["small", "medium", "large"]
+GRIP_STYLES = ["fingertip", "claw", "palm"]
+SESSIONS = [1, 89, 90, 179, 180, 600]
+DISCOMFORT = ["", "none", "wrist pain", "Wrists ache", "fingers hurt", "forearm ache", "wrist and finger", "none, wrist", "fingertip"]
+LAYOUTS = ["wasd", "esdf", "other"]
+WEIGHTS = [None, 20, 60, 61, 70, 71, 95, 96, 200]
+SPACE = ["yes", "no"]
+GAMES = ["fps", "moba", "rpg", "mmorpg", "other"]
+
+# Reference rules: the original if/elif implementation, with whole-word discomfort matching
+def reference_evaluate(hs, gs, sd, dl, kl, mw, si, gt):
+    words = set(dl.lower().replace(",", " ").split())
+    wrist = bool(words & {"wrist", "wrists"})
+    finger = bool(words & {"finger", "fingers"})
+    forearm = bool(words & {"forearm", "forearms"})
+    if "none" in words:
+        wrist = finger = forearm = False
+
+    points = 0
+    recs = []
+    if sd >= 180:
+        points += 2
+        recs.append("Long sessions detected: add structured 5-10 minute breaks every 45-60 minutes.")
+    elif sd >= 90:
+        points += 1
+        recs.append("Consider adding regular breaks to your gaming sessions.")
+    if wrist:
+        points += 2
+        recs.append("Wrist discomfort: consider a lighter mouse, neutral wrist position (avoid excessive extension), and wrist support. ")
+        recs.append("Try slight keyboard angle adjustment to keep wrists straight.")
+    if finger:
+        points += 1
+        recs.append("Finger discomfort: consider a mouse with a more ergonomic shape that supports your hand size better.")
+        recs.append("Finger discomfort: consider lighter actuation force for keys and mouse buttons.")
+    if forearm:
+        points += 1
+        recs.append("Forearm discomfort: ensure your chair and desk height allow for a 90-degree angle at the elbow.")
+    if hs == "small" and gs == "fingertip":
+        recs.append("Small hand + fingertip grip: consider a smaller, lighter mouse (40-70g) with a shape that allows for easy fingertip control.")
+    elif hs == "medium" and gs == "fingertip":
+        recs.append("Medium hand + fingertip grip: consider a lighter medium-sized mouse (50-80g) with a shape that allows for easy fingertip control.")
+    elif hs == "large" and gs == "fingertip":
+        recs.append("Large hand + fingertip grip: consider a medium-sized mouse (60-90g) with a shape that allows for easy fingertip control.")
+    elif hs == "small" and gs == "claw":
+        recs.append("Small hand + claw grip: consider a smaller mouse (40-70g) with a shape that supports the arch of your hand and allows for easy claw grip.")
+    elif hs == "medium" and gs == "claw":
+        recs.append("Medium hand + claw grip: consider a medium-sized mouse (50-80g) with a shape that supports the arch of your hand and allows for easy claw grip.")
+    elif hs == "large" and gs == "claw":
+        recs.append("Large hand + claw grip: consider a medium to larger mouse (60-100g) with a shape that supports the arch of your hand and allows for easy claw grip.")
+    elif hs == "small" and gs == "palm":
+        recs.append("Small hand + palm grip: consider a smaller mouse (40-70g) with a shape that allows your palm to rest comfortably on the rear of the mouse.")
+    elif hs == "medium" and gs == "palm":
+        recs.append("Medium hand + palm grip: consider a medium-sized mouse (50-80g) with a shape that allows your palm to rest comfortably on the rear of the mouse.")
+    elif hs == "large" and gs == "palm":
+        recs.append("Large hand + palm grip: consider a medium to larger mouse (60-100g) with a shape that allows your palm to rest comfortably on the rear of the mouse.")
+    if mw is not None:
+        if mw > 95:
+            points += 1
+            recs.append("Heavy mouse detected: consider switching to a lighter mouse (50-80g) to reduce strain.")
+        elif mw > 70:
+            points += 1
+            recs.append("Consider switching to a lighter mouse (50-70g) to reduce strain.")
+        elif mw <= 60:
+            recs.append("Your mouse weight is within a good range for ergonomic gaming.")
+    else:
+        recs.append("Mouse weight unknown: if you experience discomfort, consider checking your mouse weight.")
+    if kl == "wasd" and hs == "large":
+        recs.append("Large hands: consider trying ESDf for more key reach and centralized hand position.")
+    elif kl == "esdf" and hs == "small":
+        recs.append("Small hands: consider trying WASD for more compact key reach and centralized hand position.")
+    if si == "yes":
+        recs.append("Space constraints: consider a compact keyboard layout (e.g. 60% or 65%) and a larger mousepad to allow for better mouse positioning and reduce shoulder strain.")
+    if gt == "fps":
+        recs.append("FPS focus: prioritize consistent sensitivity and a comfortable mouse grip to reduce micro-adjustment strain.")
+    elif gt == "moba":
+        recs.append("MOBA focus: consider a mouse with good button placement for quick access to abilities and macros.")
+    elif gt == "rpg":
+        recs.append("RPG focus: consider a mouse with good comfort for longer sessions and customizable buttons for inventory management.")
+    elif gt == "mmorpg":
+        recs.append("MMORPG focus: consider a mouse with good comfort for longer sessions and customizable buttons for inventory management and macros.")
+    elif gt == "other":
+        recs.append("General gaming: focus on overall comfort, proper breaks, and ergonomic posture to reduce strain across various game types.")
+
+    if points >= 5:
+        level = "high"
+    elif points >= 3:
+        level = "moderate"
+    elif points >= 1:
+        level = "mild"
+    else:
+        level = "none"
+    return points, level, recs
+
+
+def all_inputs():
+    return itertools.product(HAND_SIZES, GRIP_STYLES, SESSIONS, DISCOMFORT, LAYOUTS, WEIGHTS, SPACE, GAMES)
+
+
+class EvaluateTests(unittest.TestCase):
+    def test_matches_reference_rules(self):
+        for inputs in all_inputs():
+            profile = ergo.UserProfile(*inputs)
+            ergo.evaluate(profile)
+            got = (profile.risk_points, profile.risk_level, list(profile.recommendations))
+            self.assertEqual(got, reference_evaluate(*inputs), inputs)
+
+    def test_batch_matches_single(self):
+        batch = [ergo.UserProfile(*inputs) for inputs in all_inputs()]
+        ergo.evaluate_batch(batch)
+        for inputs, batched in zip(all_inputs(), batch):
+            single = ergo.UserProfile(*inputs)
+            ergo.evaluate(single)
+            self.assertEqual(
+                (batched.risk_points, batched.risk_level, list(batched.recommendations)),
+                (single.risk_points, single.risk_level, list(single.recommendations)),
+                inputs,
+            )
+
+    def test_repeat_evaluate_does_not_duplicate_recommendations(self):
+        profile = ergo.UserProfile("small", "claw", 200, "wrist", "esdf", 80, "yes", "fps")
+        ergo.evaluate(profile)
+        first = list(profile.recommendations)
+        ergo.evaluate(profile)
+        self.assertEqual(list(profile.recommendations), first)
+
+
+class ParseDiscomfortTests(unittest.TestCase):
+    def flags(self, text):
+        profile = ergo.UserProfile("small", "claw", 30, text, "wasd", 50, "no", "fps")
+        ergo.parse_discomfort(profile)
+        return profile.has_wrist_pain, profile.has_finger_pain, profile.has_forearm_pain
+
+    def test_whole_words_only(self):
+        self.assertEqual(self.flags("fingertip soreness"), (False, False, False))
+        self.assertEqual(self.flags("wristpain"), (False, False, False))
+
+    def test_keywords_and_plurals(self):
+        self.assertEqual(self.flags("Wrists and FINGERS, forearm"), (True, True, True))
+
+    def test_none_overrides(self):
+        self.assertEqual(self.flags("none, maybe wrist"), (False, False, False))
+
+
+class InputHelperTests(unittest.TestCase):
+    def answer(self, func, *args, replies):
+        with mock.patch.object(ergo, "read_answer", side_effect=replies), contextlib.redirect_stdout(io.StringIO()):
+            return func(*args)
+
+    def test_ask_choise_returns_canonical_choice(self):
+        choices = ["small", "medium", "large"]
+        self.assertEqual(self.answer(ergo.ask_choise, "Hand size?", choices, replies=["  SMALL "]), "small")
+
+    def test_ask_choise_rejects_input_outside_choices(self):
+        choices = ["small", "medium", "large"]
+        for bad in ["ſmall", "huge", "", "small medium"]:
+            got = self.answer(ergo.ask_choise, "Hand size?", choices, replies=[bad, "medium"])
+            self.assertEqual(got, "medium", bad)
+
+    def test_ask_mouse_weight(self):
+        self.assertIsNone(self.answer(ergo.ask_mouse_weight, replies=["Don't Know"]))
+        self.assertEqual(self.answer(ergo.ask_mouse_weight, replies=["-5", "abc", "95"]), 95)
+        # Over CPython's int() digit limit: rejected and asked again rather than crashing
+        self.assertEqual(self.answer(ergo.ask_mouse_weight, replies=["9" * 5000, "1" * 4000, "50"]), 50)
+
+
+if __name__ == "__main__":
+    unittest.main()